@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from outlier_rules import build_sketch, outlier_bounds, outlier_mask
+from profiling import profile_column, profile_row, profile_table
+
 # Messages to explain the problems
 MSG_NULL     = "The value is null, please review this information"
 MSG_NEG      = "The value is negative, please review this information"
@@ -20,17 +23,149 @@ def add_issue_with_defectkey(issues, df, idx, col, level, msg, val):
     defect_id = df.at[idx, "Defect_ID"] if idx is not None and "Defect_ID" in df.columns else None
     issues.append([defect_id, col, level, msg, val])
 
-def validate_by_schema(df, schema, use_defect=False):
+def outlier_message(rule):
+    """Message for a value flagged by a grouped outlier rule."""
+    subject = "The value"
+    if rule.get("ratio_to"):
+        subject = f"The ratio to {rule['ratio_to']}"
+    if rule.get("group_by"):
+        return f"{subject} is an outlier within its {rule['group_by']} group; please review this information"
+    return f"{subject} is an outlier; please review this information"
+
+def validate_column(out, col, rules, add_issue, current_year, profile=None):
+    """
+    Run the schema rules of a single column.
+    The null/blank/numeric masks come from the column profile and are shared
+    by all rules; rules that cannot fire according to the profile are skipped.
+    Returns the issues found as a list of lists.
+    """
+    issues = []
+    if profile is None:
+        profile = profile_column(out[col])
+    series = out[col]
+
+    rows = profile["rows"]
+    filled = rows - profile["nulls"] - profile["blanks"]
+    parseable = profile["numeric_parseable"]
+    num_min, num_max = profile["numeric_min"], profile["numeric_max"]
+
+    # ---null/empty---
+    if rules.get("null_warning", False) and filled < rows:
+        null_like = profile["null"] | profile["blank"]
+        for i in out.index[null_like]:
+            add_issue(issues, out, i, col, "warning", MSG_NULL, out.at[i, col])
+
+    # ---completely null column: no other rule can fire---
+    if profile["nulls"] == rows:
+        return issues
+
+    # ---numeric---
+    if rules.get("numeric", False):
+        numeric_coerced = profile["numeric"]
+        if parseable < filled:
+            non_numeric_mask = ~profile["null"] & ~profile["blank"] & numeric_coerced.isna()
+            for i in out.index[non_numeric_mask]:
+                add_issue(issues, out, i, col, "error", MSG_NUMERIC, out.at[i, col])
+        series = numeric_coerced
+
+    # ---numeric rules only apply to parseable values---
+    if parseable > 0 and not pd.api.types.is_numeric_dtype(series):
+        series = profile["numeric"]
+
+    # ---integer-only---
+    if rules.get("integer", False) and parseable > 0:
+        int_mask = series.notna() & (np.floor(series) != series)
+        for i in out.index[int_mask]:
+            add_issue(issues, out, i, col, "error", MSG_NOT_INT, out.at[i, col])
+
+    # ---non-negative---
+    if rules.get("non_negative", False) and parseable > 0 and num_min < 0:
+        neg_mask = series.notna() & (series < 0)
+        for i in out.index[neg_mask]:
+            add_issue(issues, out, i, col, "error", MSG_NEG, out.at[i, col])
+
+    # ---min / max---
+    if ("min" in rules or "max" in rules) and parseable > 0:
+        if "min" in rules and num_min < rules["min"]:
+            min_mask = series.notna() & (series < rules["min"])
+            for i in out.index[min_mask]:
+                add_issue(issues, out, i, col, "error",
+                          f"Value is below minimum ({rules['min']}).",
+                          out.at[i, col])
+        if "max" in rules and num_max > rules["max"]:
+            max_mask = series.notna() & (series > rules["max"])
+            for i in out.index[max_mask]:
+                add_issue(issues, out, i, col, "error",
+                          f"Value exceeds maximum ({rules['max']}).",
+                          out.at[i, col])
+
+    # ---year constraints---
+    if (rules.get("four_digits", False) and parseable > 0
+            and (num_min < 1000 or num_max > 9999)):
+        bad_mask = series.notna() & ~series.astype("Int64").between(1000, 9999)
+        for i in out.index[bad_mask]:
+            add_issue(issues, out, i, col, "error",
+                      "The year must have four digits; please review this information.",
+                      out.at[i, col])
+
+    if rules.get("max_year_current", False) and parseable > 0 and num_max > current_year:
+        future_mask = series.notna() & (series > current_year)
+        for i in out.index[future_mask]:
+            add_issue(issues, out, i, col, "error",
+                      f"The installation year is over the expected range of values; please review this information.",
+                      out.at[i, col])
+
+    if rules.get("date_format", False):
+        date_parsed = pd.to_datetime(out[col], errors="coerce", format="%Y-%m-%d")
+        mask_failed = date_parsed.isna() & out[col].notna()
+        if mask_failed.any():
+            date_parsed.loc[mask_failed] = pd.to_datetime(
+                out.loc[mask_failed, col], errors="coerce", format="%d-%m-%Y"
+            )
+
+        invalid_date_mask = date_parsed.isna() & out[col].notna()
+        for i in out.index[invalid_date_mask]:
+            add_issue(issues, out, i, col, "error",
+                      "The installation date does not follow the expected formats (YYYY-MM-DD or DD-MM-YYYY).",
+                      out.at[i, col])
+
+    # ---grouped outliers---
+    if "outlier" in rules and parseable > 0:
+        rule = rules["outlier"]
+        sketch = build_sketch(out, col, rule)
+        outliers = outlier_mask(out, col, rule, outlier_bounds(sketch, rule))
+        for i in out.index[outliers]:
+            add_issue(issues, out, i, col, "warning", outlier_message(rule), out.at[i, col])
+
+    # ---duplicate error---
+    if rules.get("duplicate_error", False) and profile["distinct"] < rows - profile["nulls"]:
+        dup_mask = ~profile["null"] & out[col].duplicated(keep=False)
+        if dup_mask.any():
+            for val, grp in out.loc[dup_mask].groupby(col):
+                for i in grp.index:
+                    add_issue(issues, out, i, col, "error",
+                              MSG_DUP_ID if col == "Pipe_ID" else "Duplicate value found.",
+                              val)
+
+    return issues
+
+def validate_by_schema(df, schema, use_defect=False, cache=None, profile=None):
     """
     Generic schema validator.
     If use_defect=True, Defect_ID will be used instead of Pipe_ID.
+    If a RuleCache is given, the issues of columns whose rules and data
+    did not change since a previous run are taken from the cache.
+    If a list is given as profile, the data-quality profile of every column
+    (null, blank, numeric-parseable and distinct counts) is appended to it.
     """
-    issues = []  # collect issues as a list of lists
-    out = df.copy()
     current_year = datetime.now().year
 
     # ---Select correct issue adder---
     add_issue = add_issue_with_defectkey if use_defect else add_issue_with_compkey
+    id_col_name = "Defect_ID" if use_defect else "Pipe_ID"
+
+    issues = []  # collect issues as a list of lists
+    out = df.copy(deep=False)  # validation only reads the data, no full copy needed
 
     # ---Missing required columns---
     for col, rules in schema.items():
@@ -43,101 +178,31 @@ def validate_by_schema(df, schema, use_defect=False):
         if col not in out.columns:
             continue
 
-        series = out[col]
-
-        # ---null/empty---
-        if rules.get("null_warning", False):
-            null_like = series.isna() | (series.astype("string").str.strip() == "")
-            for i in out.index[null_like]:
-                add_issue(issues, out, i, col, "warning", MSG_NULL, out.at[i, col])
-
-        # ---numeric---
-        if rules.get("numeric", False):
-            ser_str = series.astype("string")
-            numeric_coerced = pd.to_numeric(ser_str, errors="coerce")
-            non_numeric_mask = ser_str.notna() & (ser_str.str.strip() != "") & numeric_coerced.isna()
-            for i in out.index[non_numeric_mask]:
-                add_issue(issues, out, i, col, "error", MSG_NUMERIC, out.at[i, col])
-            series = numeric_coerced
-
-        # ---integer-only---
-        if rules.get("integer", False):
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(out[col], errors="coerce")
-            int_mask = series.notna() & (np.floor(series) != series)
-            for i in out.index[int_mask]:
-                add_issue(issues, out, i, col, "error", MSG_NOT_INT, out.at[i, col])
-
-        # ---non-negative---
-        if rules.get("non_negative", False):
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(out[col], errors="coerce")
-            neg_mask = series.notna() & (series < 0)
-            for i in out.index[neg_mask]:
-                add_issue(issues, out, i, col, "error", MSG_NEG, out.at[i, col])
-
-        # ---min / max---
-        if "min" in rules or "max" in rules:
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(out[col], errors="coerce")
-            if "min" in rules:
-                min_mask = series.notna() & (series < rules["min"])
-                for i in out.index[min_mask]:
-                    add_issue(issues, out, i, col, "error",
-                              f"Value is below minimum ({rules['min']}).",
-                              out.at[i, col])
-            if "max" in rules:
-                max_mask = series.notna() & (series > rules["max"])
-                for i in out.index[max_mask]:
-                    add_issue(issues, out, i, col, "error",
-                              f"Value exceeds maximum ({rules['max']}).",
-                              out.at[i, col])
-
-        # ---year constraints---
-        if rules.get("four_digits", False):
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(out[col], errors="coerce")
-            bad_mask = series.notna() & ~series.astype("Int64").between(1000, 9999)
-            for i in out.index[bad_mask]:
-                add_issue(issues, out, i, col, "error",
-                          "The year must have four digits; please review this information.",
-                          out.at[i, col])
-
-        if rules.get("max_year_current", False):
-            if not pd.api.types.is_numeric_dtype(series):
-                series = pd.to_numeric(out[col], errors="coerce")
-            future_mask = series.notna() & (series > current_year)
-            for i in out.index[future_mask]:
-                add_issue(issues, out, i, col, "error",
-                          f"The installation year is over the expected range of values; please review this information.",
-                          out.at[i, col])
-
-        if rules.get("date_format", False):
-            date_parsed = pd.to_datetime(out[col], errors="coerce", format="%Y-%m-%d")
-            mask_failed = date_parsed.isna() & out[col].notna()
-            if mask_failed.any():
-                date_parsed.loc[mask_failed] = pd.to_datetime(
-                    out.loc[mask_failed, col], errors="coerce", format="%d-%m-%Y"
-                )
-
-            invalid_date_mask = date_parsed.isna() & out[col].notna()
-            for i in out.index[invalid_date_mask]:
-                add_issue(issues, out, i, col, "error",
-                          "The installation date does not follow the expected formats (YYYY-MM-DD or DD-MM-YYYY).",
-                          out.at[i, col])
-
-        # ---duplicate error---
-        if rules.get("duplicate_error", False):
-            dup_mask = out[col].notna() & out[col].duplicated(keep=False)
-            if dup_mask.any():
-                for val, grp in out.loc[dup_mask].groupby(col):
-                    for i in grp.index:
-                        add_issue(issues, out, i, col, "error",
-                                  MSG_DUP_ID if col == "Pipe_ID" else "Duplicate value found.",
-                                  val)
+        # ---cached issues and profile row (the column is not profiled on a hit)---
+        key = None
+        if cache is not None:
+            key = cache.fingerprint(out, col, rules, id_col_name, current_year)
+            entry = cache.get(key)
+            if entry is not None:
+                col_issues, col_profile_row = entry
+                issues.extend(col_issues)
+                if profile is not None:
+                    profile.append(col_profile_row)
+                continue
+
+        col_profile = profile_column(out[col])
+        col_issues = validate_column(out, col, rules, add_issue, current_year, col_profile)
+        issues.extend(col_issues)
+        if profile is not None:
+            profile.append(profile_row(col_profile))
+        if key is not None:
+            cache.put(key, (col_issues, profile_row(col_profile)))
+
+    # ---Profile of the columns outside the schema---
+    if profile is not None:
+        profile.extend(profile_table(out[[c for c in out.columns if c not in schema]]))
 
     # ---Build DataFrame of issues---
-    id_col_name = "Defect_ID" if use_defect else "Pipe_ID"
     issues_df = pd.DataFrame(
         issues,
         columns=[id_col_name, "column", "level", "message", "value"]
@@ -0,0 +1,82 @@
+import re
+import pandas as pd
+
+MAX_CATEGORY_RATIO = 0.5    # convert text columns with fewer distinct values than this ratio
+PROFILE_BYTES_PER_ROW = 32  # masks and numeric copy held while the rules of one column run
+
+# Rules that parse the column as numbers or dates; those columns keep their dtype
+_PARSING_RULES = ("numeric", "integer", "non_negative", "min", "max",
+                  "four_digits", "max_year_current", "date_format")
+
+_UNITS = {"": 1, "B": 1,
+          "K": 1024, "KB": 1024,
+          "M": 1024 ** 2, "MB": 1024 ** 2,
+          "G": 1024 ** 3, "GB": 1024 ** 3,
+          "T": 1024 ** 4, "TB": 1024 ** 4}
+
+
+def parse_memory_limit(limit):
+    """
+    Convert a memory limit to bytes.
+    Accepts a number of bytes or a string such as '512MB', '512M' or '4 GB'.
+    """
+    if limit is None or isinstance(limit, (int, float)):
+        return limit
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B?)\s*", str(limit).upper())
+    if match is None:
+        raise ValueError(f"Invalid memory_limit '{limit}'")
+    return int(float(match.group(1)) * _UNITS[match.group(2)])
+
+
+def estimate_memory(df):
+    """Estimated memory footprint of a DataFrame in bytes."""
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def estimate_working_set(df):
+    """
+    Estimated memory needed to validate df: the frame itself, plus the string
+    copy and masks built while the rules of its largest column run.
+    """
+    if df is None or df.empty:
+        return estimate_memory(df)
+    column_sizes = df.memory_usage(index=False, deep=True)
+    return estimate_memory(df) + int(column_sizes.max()) + len(df) * PROFILE_BYTES_PER_ROW
+
+
+def optimize_dtypes(df, schema=None):
+    """
+    Return a smaller version of df without copying the columns that do not change:
+      - integer columns are downcast to the smallest integer type
+      - float columns are downcast to float32 only when no value changes
+      - low-cardinality text columns become categoricals, except columns
+        whose schema rules parse them as numbers or dates
+    """
+    schema = schema or {}
+    out = df.copy(deep=False)
+
+    for col in out.columns:
+        series = out[col]
+
+        if pd.api.types.is_integer_dtype(series) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            out[col] = pd.to_numeric(series, downcast="integer")
+
+        elif pd.api.types.is_float_dtype(series) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            downcast = series.astype("float32")
+            same = (downcast.astype(series.dtype) == series) | series.isna()
+            if same.all():
+                out[col] = downcast
+
+        elif series.dtype == object or pd.api.types.is_string_dtype(series):
+            rules = schema.get(col, {})
+            if any(rule in rules for rule in _PARSING_RULES):
+                continue
+            non_null = series.dropna()
+            if non_null.empty or not non_null.map(type).eq(str).all():
+                continue
+            if series.nunique(dropna=True) < MAX_CATEGORY_RATIO * len(series):
+                out[col] = series.astype("category")
+
+    return out
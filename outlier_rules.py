@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+
+ALL_GROUP = "ALL"  # group key used when the rule has no group_by column
+
+DEFAULT_K = {"iqr": 1.5, "robust_z": 3.5, "zscore": 3.0}
+
+
+def _merge_moments(a, b):
+    """
+    Merge two (count, mean, m2) tables per group with the parallel
+    update of Chan et al., which stays accurate when values are large
+    relative to their spread.
+    """
+    if a.empty:
+        return b.copy()
+    if b.empty:
+        return a.copy()
+    groups = a.index.union(b.index)
+    a = a.reindex(groups, fill_value=0.0)
+    b = b.reindex(groups, fill_value=0.0)
+    count = a["count"] + b["count"]
+    delta = b["mean"] - a["mean"]
+    mean = a["mean"] + delta * (b["count"] / count)
+    m2 = a["m2"] + b["m2"] + delta ** 2 * a["count"] * b["count"] / count
+    return pd.DataFrame({"count": count, "mean": mean, "m2": m2})
+
+
+class GroupedSketch:
+    """
+    One-pass, mergeable statistics of a numeric column per group.
+
+    - Quantiles: log-bucket sketch with bounded relative error
+      (each value is stored in the bucket ceil(log_gamma(|x|))).
+    - Moments: count, mean and sum of squared deviations (m2).
+
+    Sketches built on separate chunks (or in parallel) can be combined
+    with merge() and give the same result as a single pass.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.min_value = 1e-9  # values closer to zero go to the zero bucket
+        self.buckets = pd.Series(dtype="float64")  # (group, sign, index) -> count
+        self.moments = pd.DataFrame(columns=["count", "mean", "m2"], dtype="float64")
+
+    def update(self, values, groups):
+        """Add a chunk of values with their group keys."""
+        values = pd.to_numeric(pd.Series(values), errors="coerce").astype("float64")
+        groups = pd.Series(groups, index=values.index)
+        valid = values.notna() & np.isfinite(values) & groups.notna()
+        values = values[valid]
+        groups = groups[valid]
+        if values.empty:
+            return self
+
+        x = values.to_numpy()
+        sign = np.sign(x) * (np.abs(x) > self.min_value)
+        magnitude = np.where(sign != 0, np.abs(x), 1.0)
+        index = np.where(sign != 0, np.ceil(np.log(magnitude) / self.log_gamma), 0)
+
+        # ---quantile buckets---
+        counts = pd.DataFrame({
+            "group": groups.to_numpy(),
+            "sign": sign.astype("int8"),
+            "index": index.astype("int64"),
+        }).value_counts().astype("float64")
+        self.buckets = self.buckets.add(counts, fill_value=0) if not self.buckets.empty else counts
+
+        # ---moments---
+        frame = pd.DataFrame({"group": groups.to_numpy(), "x": x})
+        grouped = frame.groupby("group")["x"]
+        count = grouped.size().astype("float64")
+        moments = pd.DataFrame({
+            "count": count,
+            "mean": grouped.mean(),
+            "m2": grouped.var(ddof=0) * count,
+        })
+        self.moments = _merge_moments(self.moments, moments)
+        return self
+
+    def merge(self, other):
+        """Merge another sketch (built with the same relative accuracy) into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Sketches must use the same relative_accuracy to be merged")
+        if not other.buckets.empty:
+            self.buckets = self.buckets.add(other.buckets, fill_value=0) if not self.buckets.empty else other.buckets.copy()
+        self.moments = _merge_moments(self.moments, other.moments)
+        return self
+
+    def quantiles(self, qs):
+        """Return a DataFrame (group x q) with the estimated quantiles."""
+        qs = list(qs)
+        if self.buckets.empty:
+            return pd.DataFrame(columns=qs, dtype="float64")
+
+        b = self.buckets.reset_index()
+        b.columns = ["group", "sign", "index", "count"]
+        # Order buckets by value: negatives by decreasing magnitude, zero, positives
+        b["order"] = b["sign"] * b["index"]
+        b = b.sort_values(["group", "sign", "order"])
+        b["value"] = b["sign"] * 2 * self.gamma ** b["index"].astype("float64") / (self.gamma + 1)
+
+        result = {}
+        for group, grp in b.groupby("group", sort=False):
+            cum = grp["count"].cumsum().to_numpy()
+            n = cum[-1]
+            ranks = np.array(qs) * (n - 1)
+            pos = np.searchsorted(cum, ranks, side="right")
+            result[group] = grp["value"].to_numpy()[np.minimum(pos, len(cum) - 1)]
+        return pd.DataFrame.from_dict(result, orient="index", columns=qs)
+
+    def mean_std(self):
+        """Return a DataFrame (group x [count, mean, std]) from the moments."""
+        m = self.moments
+        return pd.DataFrame({"count": m["count"], "mean": m["mean"],
+                             "std": np.sqrt(m["m2"] / m["count"])})
+
+
+def outlier_values(df, col, rule):
+    """Return the numeric values tested by an outlier rule and their group keys."""
+    values = pd.to_numeric(df[col], errors="coerce")
+    ratio_to = rule.get("ratio_to")
+    if ratio_to is not None:
+        if ratio_to not in df.columns:
+            values = pd.Series(np.nan, index=df.index)
+        else:
+            denominator = pd.to_numeric(df[ratio_to], errors="coerce")
+            values = (values / denominator).replace([np.inf, -np.inf], np.nan)
+
+    group_by = rule.get("group_by")
+    if group_by is None:
+        groups = pd.Series(ALL_GROUP, index=df.index)
+    elif group_by not in df.columns:
+        groups = pd.Series(pd.NA, index=df.index, dtype="object")
+    else:
+        groups = df[group_by].astype("string").str.strip()
+    return values, groups
+
+
+def build_sketch(chunks, col, rule):
+    """
+    Build the sketch of an outlier rule over one DataFrame or an iterable of
+    DataFrame chunks, in a single pass.
+    """
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    sketch = GroupedSketch(rule.get("relative_accuracy", 0.01))
+    for chunk in chunks:
+        if col not in chunk.columns:
+            continue
+        values, groups = outlier_values(chunk, col, rule)
+        sketch.update(values, groups)
+    return sketch
+
+
+def outlier_bounds(sketch, rule):
+    """
+    Lower/upper bounds per group for the rule method:
+      - 'iqr':      [Q1 - k*IQR, Q3 + k*IQR]
+      - 'robust_z': median +/- k * IQR/1.349 (robust estimate of the std)
+      - 'zscore':   mean +/- k * std
+    Groups with fewer than min_group_size values or no spread are skipped.
+    """
+    method = rule.get("method", "iqr")
+    if method not in DEFAULT_K:
+        raise ValueError(f"Unknown outlier method '{method}'")
+    k = rule.get("k", DEFAULT_K[method])
+    min_group_size = rule.get("min_group_size", 10)
+
+    stats = sketch.mean_std()
+    if method == "zscore":
+        center, scale = stats["mean"], stats["std"]
+        lower, upper = center - k * scale, center + k * scale
+    else:
+        q = sketch.quantiles([0.25, 0.5, 0.75]).reindex(stats.index)
+        iqr = q[0.75] - q[0.25]
+        if method == "iqr":
+            scale = iqr
+            lower, upper = q[0.25] - k * iqr, q[0.75] + k * iqr
+        else:
+            scale = iqr / 1.349
+            lower, upper = q[0.5] - k * scale, q[0.5] + k * scale
+
+    bounds = pd.DataFrame({"lower": lower, "upper": upper})
+    keep = (stats["count"] >= min_group_size) & (scale > 0)
+    return bounds[keep]
+
+
+def outlier_mask(df, col, rule, bounds):
+    """Boolean mask of the rows of df outside the bounds of their group."""
+    values, groups = outlier_values(df, col, rule)
+    lower = groups.map(bounds["lower"]).astype("float64")
+    upper = groups.map(bounds["upper"]).astype("float64")
+    return (values.notna() & lower.notna() & ((values < lower) | (values > upper))).fillna(False)
@@ -0,0 +1,43 @@
+import pandas as pd
+
+PROFILE_COLUMNS = ["column", "rows", "nulls", "blanks", "numeric_parseable",
+                   "distinct", "numeric_min", "numeric_max"]
+
+
+def profile_column(series):
+    """
+    Single profiling pass over a column.
+    Returns a dict with the masks shared by the rules (null, blank and the
+    numeric version of the column) and the counts used to skip rules that
+    cannot fire. The text copy of the column is only held during profiling.
+    """
+    text = series.astype("string")
+    null = series.isna()
+    blank = (text.str.strip() == "").fillna(False).astype(bool) & ~null
+    numeric = pd.to_numeric(text, errors="coerce")
+    parseable = numeric.notna()
+
+    n_parseable = int(parseable.sum())
+    return {
+        "column": series.name,
+        "null": null,
+        "blank": blank,
+        "numeric": numeric,
+        "rows": len(series),
+        "nulls": int(null.sum()),
+        "blanks": int(blank.sum()),
+        "numeric_parseable": n_parseable,
+        "distinct": int(series.nunique(dropna=True)),
+        "numeric_min": numeric.min() if n_parseable else None,
+        "numeric_max": numeric.max() if n_parseable else None,
+    }
+
+
+def profile_row(profile):
+    """Counts of a column profile as a row of the data-quality sheet."""
+    return [profile[c] for c in PROFILE_COLUMNS]
+
+
+def profile_table(df):
+    """Profile every column of df. Returns one row of counts per column."""
+    return [profile_row(profile_column(df[col])) for col in df.columns]
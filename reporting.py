@@ -2,6 +2,8 @@ import pandas as pd
 from pathlib import Path
 from typing import Tuple
 
+from profiling import PROFILE_COLUMNS
+
 def build_summary(pipes_issues, cctv_issues, defects_issues, hydraulics_issues):
     """Build summary of the results"""
     def counts(df) -> Tuple[int, int]:
@@ -21,6 +23,17 @@ def build_summary(pipes_issues, cctv_issues, defects_issues, hydraulics_issues):
     return summary
 
 
+def build_profile(pipes_profile, cctv_profile, defects_profile, hydraulics_profile):
+    """Build the data-quality profile of the columns of every entity"""
+    rows = []
+    for entity, profile in [("PIPES", pipes_profile), ("CCTV", cctv_profile),
+                            ("DEFECTS", defects_profile),
+                            ("HYDRAULIC_PROPERTIES", hydraulics_profile)]:
+        for row in profile or []:
+            rows.append([entity] + list(row))
+    return pd.DataFrame(rows, columns=["Entity"] + PROFILE_COLUMNS)
+
+
 def safe_to_excel(df, sheet_name, xlw, id_col="Pipe_ID"):
     """Write df to Excel ensuring at least the id_col exists."""
     if df is None or df.empty:
@@ -28,10 +41,14 @@ def safe_to_excel(df, sheet_name, xlw, id_col="Pipe_ID"):
     df.to_excel(xlw, sheet_name=sheet_name, index=False)
 
 
-def write_report(report_path, summary):
+def write_report(report_path, summary, delta_summary=None, profile=None):
     """Write results"""
     with pd.ExcelWriter(report_path, engine="openpyxl") as xlw:
         summary.to_excel(xlw, sheet_name="SUMMARY", index=False)
+        if delta_summary is not None:
+            delta_summary.to_excel(xlw, sheet_name="DELTA", index=False)
+        if profile is not None:
+            profile.to_excel(xlw, sheet_name="DATA_QUALITY", index=False)
 
 # ---Result dialog---
 
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import pickle
+import pandas as pd
+from pathlib import Path
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# Bump when the format of the cached entries changes
+CACHE_VERSION = 2
+
+# Modules whose code decides the cached results; any edit to them invalidates the cache
+_IMPLEMENTATION_FILES = ("core_validation.py", "outlier_rules.py", "profiling.py")
+
+
+def _implementation_hash():
+    """Hash of the cache version and the source of the validation modules."""
+    h = hashlib.sha256(str(CACHE_VERSION).encode("utf-8"))
+    base_dir = Path(__file__).resolve().parent
+    for name in _IMPLEMENTATION_FILES:
+        path = base_dir / name
+        if path.exists():
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class RuleCache:
+    """
+    On-disk cache of the issues produced by the rules of one column, stored
+    together with the column's data-quality profile row.
+
+    Entries are keyed by a fingerprint of the column rules and the column
+    data, so after a schema edit only the columns whose rules changed are
+    validated again. The cache is bounded by max_bytes; the least recently
+    used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.implementation = _implementation_hash()
+
+    def fingerprint(self, df, col, rules, id_col, current_year):
+        """Fingerprint of a (column rules, column data) pair."""
+        h = hashlib.sha256(self.implementation.encode("utf-8"))
+
+        # ---rule definition---
+        h.update(json.dumps(
+            {"column": col, "rules": rules, "id_col": id_col, "year": current_year},
+            sort_keys=True, default=str
+        ).encode("utf-8"))
+
+        # ---column data (plus the ids reported and columns used by outlier rules)---
+        outlier = rules.get("outlier", {})
+        referenced = (id_col, col, outlier.get("group_by"), outlier.get("ratio_to"))
+        cols = [c for c in referenced if c is not None and c in df.columns]
+        cols = list(dict.fromkeys(cols))
+        h.update(str([str(df[c].dtype) for c in cols]).encode("utf-8"))
+        row_hashes = pd.util.hash_pandas_object(df[cols], index=True)
+        h.update(row_hashes.to_numpy().tobytes())
+
+        # ---value types of object columns (hash_pandas_object hashes 1 and "1" alike)---
+        for c in cols:
+            if df[c].dtype == object:
+                types = df[c].map(lambda v: type(v).__qualname__)
+                h.update(pd.util.hash_pandas_object(types, index=False).to_numpy().tobytes())
+
+        return h.hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key):
+        """Return the cached (issues, profile row) for key, or None if not cached."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        os.utime(path)  # mark as recently used
+        return entry
+
+    def put(self, key, entry):
+        """Store the (issues, profile row) entry for key and evict old entries if needed."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for p in self.cache_dir.glob("*.pkl"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        for p in self.cache_dir.glob("*.pkl"):
+            p.unlink(missing_ok=True)
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Issue files exported by main() for each entity, with the id column used as key
+ENTITY_ISSUE_FILES = {
+    "PIPES": ("pipes_issues", "Pipe_ID"),
+    "CCTV": ("cctv_issues", "Pipe_ID"),
+    "DEFECTS": ("defects_issues", "Defect_ID"),
+    "HYDRAULIC_PROPERTIES": ("hydraulics_issues", "Pipe_ID"),
+}
+
+STATUS_FIXED = "fixed"
+STATUS_NEW = "new"
+STATUS_OPEN = "open"
+
+
+def load_issues(output_dir, name):
+    """
+    Load an issues file exported by export_issues (Excel or CSV).
+    If both formats exist (e.g. a small run followed by a large one in the
+    same folder), the most recently written file is used.
+    Returns None if the file does not exist.
+    """
+    output_dir = Path(output_dir)
+    candidates = [p for p in (output_dir / f"{name}.xlsx", output_dir / f"{name}.csv")
+                  if p.exists()]
+    if not candidates:
+        return None
+    path = max(candidates, key=lambda p: p.stat().st_mtime_ns)
+    if path.suffix == ".xlsx":
+        return pd.read_excel(path)
+    return pd.read_csv(path)
+
+
+def canonical_ids(ids):
+    """
+    Render ids in one canonical string form so the same id matches whatever
+    dtype it was read with. Only the float round trip is undone: integral
+    float values and text ending in ".0" lose the decimals (2, 2.0 and "2.0"
+    all become "2"). Other text ids are only stripped, so "007" and "7"
+    stay different.
+    """
+    ids = pd.Series(ids, dtype="object")
+    text = ids.astype("string").str.strip()
+
+    # ---float values (ids read back from a column with blanks)---
+    is_float = ids.map(lambda v: isinstance(v, (float, np.floating))).astype(bool)
+    floats = ids[is_float].astype("float64")
+    integral = floats.notna() & np.isfinite(floats) & (floats == np.floor(floats)) & (floats.abs() < 2 ** 63)
+    integral_index = integral.index[integral]
+    text[integral_index] = floats[integral_index].astype("int64").astype("string")
+
+    # ---text written from a float id---
+    return text.str.replace(r"^(-?\d+)\.0+$", r"\1", regex=True)
+
+
+def hash_issue_keys(df, id_col):
+    """
+    Hash the (id, column, message) key of every issue into a uint64 array.
+    Ids are compared in canonical form so ids read back from Excel/CSV
+    (e.g. as floats when the column has blanks) match the current run.
+    Repeated keys (null ids, duplicate ids) are numbered by occurrence, so
+    the nth copy of a key only matches the nth copy on the other side.
+    """
+    if df is None or df.empty:
+        return pd.Series([], dtype="uint64")
+    keys = pd.DataFrame({
+        "id": canonical_ids(df[id_col] if id_col in df.columns
+                            else pd.Series(pd.NA, index=df.index)),
+        "column": df["column"].astype("string"),
+        "message": df["message"].astype("string"),
+    })
+    key_hash = pd.util.hash_pandas_object(keys, index=False)
+    occurrence = key_hash.groupby(key_hash, sort=False).cumcount()
+    return pd.util.hash_pandas_object(
+        pd.DataFrame({"key": key_hash.to_numpy(), "occurrence": occurrence.to_numpy()}),
+        index=False
+    )
+
+
+def compare_issues(previous, current, id_col="Pipe_ID"):
+    """
+    Compare the issues of two runs for one entity.
+    Issues are matched on (id, column, message, occurrence) through hashed
+    keys and a hash-table membership test, so the cost is linear in the
+    number of issues.
+    Returns the delta DataFrame with a 'status' column (fixed, new or open).
+    """
+    columns = [id_col, "column", "level", "message", "value"]
+    if previous is None:
+        previous = pd.DataFrame(columns=columns)
+    if current is None:
+        current = pd.DataFrame(columns=columns)
+
+    prev_hash = hash_issue_keys(previous, id_col)
+    cur_hash = hash_issue_keys(current, id_col)
+
+    # ---membership of each key on the other side---
+    cur_in_prev = cur_hash.isin(prev_hash).to_numpy()
+    prev_in_cur = prev_hash.isin(cur_hash).to_numpy()
+
+    current_delta = current.reindex(columns=columns)
+    current_delta["status"] = STATUS_NEW
+    current_delta.loc[cur_in_prev, "status"] = STATUS_OPEN
+
+    fixed_delta = previous.reindex(columns=columns).loc[~prev_in_cur].copy()
+    fixed_delta["status"] = STATUS_FIXED
+
+    delta = pd.concat([current_delta, fixed_delta], ignore_index=True)
+    return delta
+
+
+def build_delta_summary(deltas):
+    """Build counts of fixed, new and open issues per entity."""
+    def counts(df):
+        if df is None or df.empty:
+            return (0, 0, 0)
+        status = df["status"]
+        return (int((status == STATUS_FIXED).sum()),
+                int((status == STATUS_NEW).sum()),
+                int((status == STATUS_OPEN).sum()))
+
+    rows = []
+    for entity in ENTITY_ISSUE_FILES:
+        fixed, new, still_open = counts(deltas.get(entity))
+        rows.append([entity, fixed, new, still_open])
+    return pd.DataFrame(rows, columns=["Entity", "Fixed", "New", "Open"])
+
+
+def compare_runs(previous_dir, current):
+    """
+    Compare the current run against the output of a previous run.
+
+    :param previous_dir: output directory of the previous run
+    :param current: output directory of the current run, or a dict
+                    {entity: issues DataFrame} with the current issues
+    :return: dict {entity: delta DataFrame}, delta summary DataFrame
+    """
+    deltas = {}
+    for entity, (name, id_col) in ENTITY_ISSUE_FILES.items():
+        previous_issues = load_issues(previous_dir, name)
+        if isinstance(current, dict):
+            current_issues = current.get(entity)
+        else:
+            current_issues = load_issues(current, name)
+        deltas[entity] = compare_issues(previous_issues, current_issues, id_col=id_col)
+
+    return deltas, build_delta_summary(deltas)
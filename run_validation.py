@@ -13,17 +13,31 @@ from validation_entities import (
 
 from reporting import (
     build_summary,
+    build_profile,
     write_report,
     export_issues,
     _open_path_in_os,
 )
 
+from run_comparison import compare_runs
+from rule_cache import RuleCache, DEFAULT_CACHE_MAX_BYTES
+from snapshot_cache import snapshot_key, load_snapshot, save_snapshot
+from memory_budget import parse_memory_limit, estimate_memory, estimate_working_set, optimize_dtypes
+
+from schemas import (
+    pipes_schema,
+    cctv_schema,
+    defects_schema,
+    hydraulics_schema
+)
+
 from core_validation import MSG_NO_UPLOADED
 
 def load_input_data(
     source_type,
     source_path,
-    sheet_names=None
+    sheet_names=None,
+    snapshot_dir=None
 ):
     """
     Load input data from either a SQLite database or an Excel file.
@@ -31,9 +45,20 @@ def load_input_data(
     :param source_type: 'database' or 'excel'
     :param source_path: path to database or Excel file
     :param sheet_names: list of sheet names (required for Excel)
+    :param snapshot_dir: optional folder for Arrow snapshots of the loaded data;
+                         an unchanged source is mapped from its snapshot instead
+                         of being parsed again
     :return: df_pipes, df_cctv, df_defects, df_hydraulics
     """
 
+    # --- snapshot of a previous load ---
+    key = None
+    if snapshot_dir is not None and source_type in ("database", "excel"):
+        key = snapshot_key(source_type, source_path, sheet_names)
+        frames = load_snapshot(snapshot_dir, key)
+        if frames is not None:
+            return frames
+
     df_hydraulics = None
 
     if source_type == "database":
@@ -62,6 +87,9 @@ def load_input_data(
     else:
         raise ValueError("source_type must be 'database' or 'excel'")
 
+    if key is not None:
+        save_snapshot(snapshot_dir, key, (df_pipes, df_cctv, df_defects, df_hydraulics))
+
     return df_pipes, df_cctv, df_defects, df_hydraulics
 
 def main(
@@ -69,11 +97,28 @@ def main(
     source_path,
     sheet_names=None,
     output_dir=None,
+    previous_output_dir=None,
+    cache_dir=None,
+    cache_max_bytes=DEFAULT_CACHE_MAX_BYTES,
+    snapshot_dir=None,
+    memory_limit=None,
     auto_open_report=False,
     open_containing_folder=True
 ):
     """
     Run validation workflow
+
+    If previous_output_dir is given, the issues are compared against that
+    run's output and the fixed/new/open issues are exported as well.
+    If cache_dir is given, rule results are cached there and reused for
+    columns whose rules and data did not change.
+    If snapshot_dir is given, loaded inputs are kept there as Arrow snapshots
+    and reused while the source file does not change.
+    If memory_limit is given (bytes or a string such as '4GB'), the loaded
+    data is shrunk with smaller dtypes and a warning is printed when the
+    estimated footprint of validation exceeds the limit. The limit is not
+    enforced. In that case the returned frames are the shrunk ones
+    (downcast numbers, categorical text), not the frames as loaded.
     """
 
     try:
@@ -84,9 +129,27 @@ def main(
         df_pipes, df_cctv, df_defects, df_hydraulics = load_input_data(
             source_type=source_type,
             source_path=source_path,
-            sheet_names=sheet_names
+            sheet_names=sheet_names,
+            snapshot_dir=snapshot_dir
         )
 
+        # --- memory budget ---
+        memory_limit = parse_memory_limit(memory_limit)
+        if memory_limit is not None:
+            df_pipes = optimize_dtypes(df_pipes, pipes_schema)
+            df_cctv = optimize_dtypes(df_cctv, cctv_schema)
+            df_defects = optimize_dtypes(df_defects, defects_schema)
+            if df_hydraulics is not None:
+                df_hydraulics = optimize_dtypes(df_hydraulics, hydraulics_schema)
+
+            # all frames stay loaded, plus the working set of the largest column being validated
+            frames = [df for df in (df_pipes, df_cctv, df_defects, df_hydraulics) if df is not None]
+            footprint = (sum(estimate_memory(df) for df in frames)
+                         + max(estimate_working_set(df) - estimate_memory(df) for df in frames))
+            if footprint > memory_limit:
+                print(f"Warning: validation is estimated to need about {footprint / 1024 ** 2:.0f} MB, "
+                      f"above the memory limit of {memory_limit / 1024 ** 2:.0f} MB")
+
         # --- output directory ---
         if output_dir is None:
             BASE_DIR = Path().resolve()
@@ -96,13 +159,19 @@ def main(
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # --- rule cache ---
+        cache = RuleCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
+
+        # --- data-quality profile of each entity (filled during validation) ---
+        pipes_profile, cctv_profile, defects_profile, hydraulics_profile = [], [], [], []
+
         # --- validate pipes ---
         if df_pipes.empty:
             pipes_issues = pd.DataFrame(
                 [{"Pipe_ID": pd.NA, "column": "pipe", "level": "warning", "message": MSG_NO_UPLOADED}]
             )
         else:
-            _, pipes_issues, _ = validate_pipes(df_pipes)
+            _, pipes_issues, _ = validate_pipes(df_pipes, cache=cache, profile=pipes_profile)
 
         # --- validate cctv ---
         if df_cctv.empty:
@@ -110,7 +179,7 @@ def main(
                 [{"Pipe_ID": pd.NA, "column": "inspection", "level": "warning", "message": MSG_NO_UPLOADED}]
             )
         else:
-            _, cctv_issues, _ = validate_cctv(df_cctv)
+            _, cctv_issues, _ = validate_cctv(df_cctv, cache=cache, profile=cctv_profile)
 
         # --- validate defects ---
         if df_defects.empty:
@@ -118,7 +187,7 @@ def main(
                 [{"Defect_ID": pd.NA, "column": "defect", "level": "warning", "message": MSG_NO_UPLOADED}]
             )
         else:
-            _, defects_issues, _ = validate_defects(df_defects)
+            _, defects_issues, _ = validate_defects(df_defects, cache=cache, profile=defects_profile)
 
         # --- validate hydraulics ---
         if df_hydraulics is None or df_hydraulics.empty:
@@ -126,20 +195,43 @@ def main(
                 [{"Pipe_ID": pd.NA, "column": "hydraulic_properties", "level": "warning", "message": MSG_NO_UPLOADED}]
             )
         else:
-            _, hydraulics_issues, _ = validate_hydraulics(df_hydraulics)
+            _, hydraulics_issues, _ = validate_hydraulics(df_hydraulics, cache=cache, profile=hydraulics_profile)
 
         # --- summary ---
         summary = build_summary(pipes_issues, cctv_issues, defects_issues, hydraulics_issues)
+        profile = build_profile(pipes_profile, cctv_profile, defects_profile, hydraulics_profile)
+
+        # --- comparison with previous run ---
+        delta_summary = None
+        if previous_output_dir is not None:
+            deltas, delta_summary = compare_runs(
+                previous_output_dir,
+                {
+                    "PIPES": pipes_issues,
+                    "CCTV": cctv_issues,
+                    "DEFECTS": defects_issues,
+                    "HYDRAULIC_PROPERTIES": hydraulics_issues,
+                }
+            )
 
         report_path = output_dir / "Summary.xlsx"
-        write_report(report_path, summary)
+        write_report(report_path, summary, delta_summary, profile)
 
         export_issues(pipes_issues, "pipes_issues", output_dir)
         export_issues(cctv_issues, "cctv_issues", output_dir)
         export_issues(defects_issues, "defects_issues", output_dir)
         export_issues(hydraulics_issues, "hydraulics_issues", output_dir)
 
+        if delta_summary is not None:
+            export_issues(deltas["PIPES"], "pipes_issues_delta", output_dir)
+            export_issues(deltas["CCTV"], "cctv_issues_delta", output_dir)
+            export_issues(deltas["DEFECTS"], "defects_issues_delta", output_dir)
+            export_issues(deltas["HYDRAULIC_PROPERTIES"], "hydraulics_issues_delta", output_dir)
+
         print(summary.to_string(index=False))
+        if delta_summary is not None:
+            print("\nChanges since previous run:")
+            print(delta_summary.to_string(index=False))
         print(f"\nA validation report was generated at:\n{report_path}")
 
         if AUTO_OPEN_REPORT:
@@ -36,7 +36,12 @@ pipes_schema = {
     "Slope": {
         "numeric": True,
         "non_negative": True,
-        "null_warning": True
+        "null_warning": True,
+        "outlier": {
+            "group_by": "Material",
+            "method": "robust_z",
+            "k": 3.5
+        }
     },
 
     "Depth": {
@@ -314,7 +319,12 @@ hydraulics_schema = {
     "Wet_peak_velocity": {
         "numeric": True,
         "non_negative": True,
-        "null_warning": True
+        "null_warning": True,
+        "outlier": {
+            "ratio_to": "Dry_peak_velocity",
+            "method": "iqr",
+            "k": 3.0
+        }
     },
 
     "Dry_peak_velocity": {
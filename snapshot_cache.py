@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import numpy as np
+import pandas as pd
+from datetime import datetime, time
+from pathlib import Path
+
+ENTITIES = ["PIPES", "CCTV", "DEFECTS", "HYDRAULIC_PROPERTIES"]
+
+MIXED_METADATA_KEY = b"snapshot_mixed_columns"
+TAG_PREFIX = "__type__"
+
+# Type tag of the values of mixed columns, and how each is rebuilt from text.
+# Values of any other type are stored pickled (tag 'p').
+_ENCODE_TAGS = {
+    str: "s", int: "i", float: "f", bool: "b", type(None): "n",
+    np.int64: "I", np.float64: "F",
+    datetime: "t", pd.Timestamp: "T", time: "h",
+}
+_DECODERS = {
+    "s": lambda v: v,
+    "i": int,
+    "f": float,
+    "b": lambda v: v == "True",
+    "n": lambda v: None,
+    "I": lambda v: np.int64(v),
+    "F": lambda v: np.float64(v),
+    "t": datetime.fromisoformat,
+    "T": pd.Timestamp,
+    "h": time.fromisoformat,
+    "p": lambda v: pickle.loads(bytes.fromhex(v)),
+}
+
+
+def _hash_file(path, chunk_size=1024 * 1024):
+    """SHA-256 of the content of a file."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def snapshot_key(source_type, source_path, sheet_names=None):
+    """
+    Key of the snapshot of a source file: a prefix derived from the source path
+    and a suffix from its size, mtime, content hash and the load options.
+    """
+    source_path = Path(source_path).resolve()
+    st = source_path.stat()
+    path_part = hashlib.sha256(str(source_path).encode("utf-8")).hexdigest()[:16]
+    content = "|".join([
+        source_type,
+        str(sorted(sheet_names) if sheet_names else None),
+        str(st.st_size),
+        str(st.st_mtime_ns),
+        _hash_file(source_path),
+    ])
+    content_part = hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+    return f"{path_part}_{content_part}"
+
+
+def _encode_mixed(series):
+    """
+    Encode an object column that Arrow cannot store (e.g. numbers mixed with
+    text) as a string column plus a per-value type tag column.
+    """
+    tags = series.map(lambda v: _ENCODE_TAGS.get(type(v), "p"))
+    text = pd.Series(None, index=series.index, dtype="object")
+    for tag in tags.unique():
+        mask = tags == tag
+        if tag == "n":
+            continue
+        if tag == "p":
+            text[mask] = series[mask].map(lambda v: pickle.dumps(v).hex())
+        elif tag in ("t", "T", "h"):
+            text[mask] = series[mask].map(lambda v: v.isoformat())
+        elif tag in ("f", "F"):
+            text[mask] = series[mask].map(repr)
+        else:
+            text[mask] = series[mask].map(str)
+    return text, tags
+
+
+def _decode_mixed(text, tags):
+    """Rebuild the original values of a column encoded by _encode_mixed."""
+    values = pd.Series(None, index=text.index, dtype="object")
+    for tag in pd.unique(tags):
+        mask = (tags == tag).to_numpy()
+        values[mask] = [_DECODERS[tag](v) for v in text[mask]]
+    return values
+
+
+def _to_table(pa, df):
+    """Arrow table of df; columns Arrow cannot store are tag-encoded."""
+    df = df.copy(deep=False)
+    mixed = []
+    for col in list(df.columns):
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except pa.ArrowException:
+            text, tags = _encode_mixed(df[col])
+            df[col] = text
+            df[f"{TAG_PREFIX}{col}"] = tags
+            mixed.append(col)
+
+    table = pa.Table.from_pandas(df)
+    metadata = dict(table.schema.metadata or {})
+    metadata[MIXED_METADATA_KEY] = json.dumps(mixed).encode("utf-8")
+    return table.replace_schema_metadata(metadata)
+
+
+def _from_table(table):
+    """DataFrame of an Arrow table written by _to_table."""
+    metadata = table.schema.metadata or {}
+    mixed = json.loads(metadata.get(MIXED_METADATA_KEY, b"[]"))
+    df = table.to_pandas()
+    for col in mixed:
+        tag_col = f"{TAG_PREFIX}{col}"
+        df[col] = _decode_mixed(df[col].astype("object"), df[tag_col].astype("object"))
+        df = df.drop(columns=tag_col)
+    return df
+
+
+def load_snapshot(snapshot_dir, key):
+    """
+    Map the Arrow IPC snapshot of each entity from disk.
+    Returns (df_pipes, df_cctv, df_defects, df_hydraulics) or None if there
+    is no complete snapshot (or pyarrow is not installed).
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    folder = Path(snapshot_dir) / key
+    paths = [folder / f"{entity}.arrow" for entity in ENTITIES]
+    if not all(p.exists() for p in paths):
+        return None
+
+    frames = []
+    try:
+        for p in paths:
+            with pa.memory_map(str(p), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            frames.append(_from_table(table))
+    except (OSError, pa.ArrowException):
+        return None
+    return tuple(frames)
+
+
+def save_snapshot(snapshot_dir, key, frames):
+    """
+    Write the loaded entities as Arrow IPC files and remove older snapshots
+    of the same source. Object columns mixing types (e.g. numbers and text)
+    are stored as text plus a type tag per value and restored on load.
+    Returns False if the snapshot could not be written.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return False
+
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    folder = snapshot_dir / key
+    tmp_folder = snapshot_dir / f"{key}.tmp"
+    shutil.rmtree(tmp_folder, ignore_errors=True)
+    tmp_folder.mkdir()
+
+    try:
+        for entity, df in zip(ENTITIES, frames):
+            if df is None:
+                df = pd.DataFrame()
+            table = _to_table(pa, df)
+            with pa.OSFile(str(tmp_folder / f"{entity}.arrow"), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+    except (OSError, pa.ArrowException) as e:
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        print(f"Input snapshot not written, the source will be parsed again next time: {e}")
+        return False
+
+    shutil.rmtree(folder, ignore_errors=True)
+    os.replace(tmp_folder, folder)
+
+    # ---drop outdated snapshots of the same source---
+    path_part = key.split("_")[0]
+    for old in snapshot_dir.glob(f"{path_part}_*"):
+        if old.name != key:
+            shutil.rmtree(old, ignore_errors=True)
+    return True
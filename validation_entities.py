@@ -10,32 +10,35 @@ from core_validation import (
     add_issue_with_defectkey
 )
 
-def validate_pipes(df_pipes):
+def validate_pipes(df_pipes, cache=None, profile=None):
     """
     Pipes validation.
     Required: Pipe_ID
     """
-    issues = validate_by_schema(df_pipes, pipes_schema, use_defect=False)
+    issues = validate_by_schema(df_pipes, pipes_schema, use_defect=False, cache=cache,
+                                profile=profile)
     ok = not (issues["level"] == "error").any() if not issues.empty else True
     return df_pipes, issues, ok
 
-def validate_cctv(df_cctv) :
+def validate_cctv(df_cctv, cache=None, profile=None) :
     """
     CCTV validation
     Required: Pipe_ID
     """
-    issues = validate_by_schema(df_cctv, cctv_schema, use_defect=False)
+    issues = validate_by_schema(df_cctv, cctv_schema, use_defect=False, cache=cache,
+                                profile=profile)
     ok = not (issues["level"] == "error").any() if not issues.empty else True
     return df_cctv, issues, ok
 
-def validate_defects(df_defects):
+def validate_defects(df_defects, cache=None, profile=None):
     """
     Defects validation
     Extra checks:
       - Quantification must be S, M or L
     """
 
-    issues_df = validate_by_schema(df_defects, defects_schema, use_defect=True)
+    issues_df = validate_by_schema(df_defects, defects_schema, use_defect=True, cache=cache,
+                                   profile=profile)
 
     # Convert to list to collect extra issues
     extra_issues = []
@@ -63,7 +66,7 @@ def validate_defects(df_defects):
     ok = not (issues_df["level"] == "error").any() if not issues_df.empty else True
     return df_defects, issues_df, ok
 
-def validate_hydraulics(df_hydraulics):
+def validate_hydraulics(df_hydraulics, cache=None, profile=None):
     """
     Hydraulic properties validation.
     Required: Pipe_ID
@@ -71,7 +74,9 @@ def validate_hydraulics(df_hydraulics):
     issues = validate_by_schema(
         df_hydraulics,
         hydraulics_schema,
-        use_defect=False
+        use_defect=False,
+        cache=cache,
+        profile=profile
     )
 
     ok = not (issues["level"] == "error").any() if not issues.empty else True